@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class Action:
+    __slots__ = ("entity",)
+
     def __init__(self, entity: Actor) -> None:
         super().__init__()
         self.entity = entity
@@ -35,6 +37,8 @@ class Action:
 class PickupAction(Action):
     """Pickup an item and add it to the inventory, if there is room for it."""
 
+    __slots__ = ()
+
     def __init__(self, entity: Actor):
         super().__init__(entity)
 
@@ -43,22 +47,25 @@ class PickupAction(Action):
         actor_location_y = self.entity.y
         inventory = self.entity.inventory
 
-        for item in self.engine.game_map.items:
-            if actor_location_x == item.x and actor_location_y == item.y:
-                if len(inventory.items) >= inventory.capacity:
-                    raise exceptions.Impossible("Your inventory is full.")
+        for item in self.engine.game_map.get_items_at_location(
+            actor_location_x, actor_location_y
+        ):
+            if len(inventory.items) >= inventory.capacity:
+                raise exceptions.Impossible("Your inventory is full.")
 
-                self.engine.game_map.entities.remove(item)
-                item.parent = self.entity.inventory
-                inventory.items.append(item)
+            self.engine.game_map.remove_entity(item)
+            item.parent = self.entity.inventory
+            inventory.items.append(item)
 
-                self.engine.message_log.add_message(f"You picked up the {item.name}!")
-                return
+            self.engine.message_log.add_message(f"You picked up the {item.name}!")
+            return
 
         raise exceptions.Impossible("There is nothing here to pick up.")
 
 
 class ItemAction(Action):
+    __slots__ = ("item", "target_xy")
+
     def __init__(
         self, entity: Actor, item: Item, target_xy: Optional[Tuple[int, int]] = None
     ):
@@ -80,6 +87,8 @@ class ItemAction(Action):
 
 
 class DropItem(ItemAction):
+    __slots__ = ()
+
     def perform(self) -> None:
         if self.entity.equipment.item_is_equipped(self.item):
             self.entity.equipment.toggle_equip(self.item)
@@ -88,6 +97,8 @@ class DropItem(ItemAction):
 
 
 class EquipAction(Action):
+    __slots__ = ("item",)
+
     def __init__(self, entity: Actor, item: Item):
         super().__init__(entity)
 
@@ -98,11 +109,15 @@ class EquipAction(Action):
 
 
 class WaitAction(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         pass
 
 
 class TakeStairsAction(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         """
         Take the stairs, if any exist at the entity's location.
@@ -117,6 +132,8 @@ class TakeStairsAction(Action):
 
 
 class ActionWithDirection(Action):
+    __slots__ = ("dx", "dy")
+
     def __init__(self, entity: Actor, dx: int, dy: int):
         super().__init__(entity)
 
@@ -143,51 +160,71 @@ class ActionWithDirection(Action):
 
 
 class MeleeAction(ActionWithDirection):
+    __slots__ = ()
+
     def perform(self) -> None:
-        target = self.target_actor
-        if not target:
-            raise exceptions.Impossible("Nothing to attack.")
+        perform_melee(self.entity, self.dx, self.dy)
 
-        damage = self.entity.fighter.power - target.fighter.defense
 
-        attack_desc = f"{self.entity.name.capitalize()} attacks {target.name}"
-        if self.entity is self.engine.player:
-            attack_color = color.player_atk
-        else:
-            attack_color = color.enemy_atk
+class MovementAction(ActionWithDirection):
+    __slots__ = ()
 
-        if damage > 0:
-            self.engine.message_log.add_message(
-                f"{attack_desc} for {damage} hit points.", attack_color
-            )
-            target.fighter.hp -= damage
-        else:
-            self.engine.message_log.add_message(
-                f"{attack_desc} but does no damage.", attack_color
-            )
+    def perform(self) -> None:
+        perform_movement(self.entity, self.dx, self.dy)
 
 
-class MovementAction(ActionWithDirection):
+class BumpAction(ActionWithDirection):
+    __slots__ = ()
+
     def perform(self) -> None:
-        dest_x, dest_y = self.dest_xy
+        perform_bump(self.entity, self.dx, self.dy)
 
-        if not self.engine.game_map.in_bounds(dest_x, dest_y):
-            # Destination is out of bounds.
-            raise exceptions.Impossible("That way is blocked.")
-        if not self.engine.game_map.tiles["walkable"][dest_x, dest_y]:
-            # Destination is blocked by a tile.
-            raise exceptions.Impossible("That way is blocked.")
-        if self.engine.game_map.get_blocking_entity_at_location(dest_x, dest_y):
-            # Destination is blocked by an entity.
-            raise exceptions.Impossible("That way is blocked.")
 
-        self.entity.move(self.dx, self.dy)
+# The directional actions as plain functions.  AI turns call these directly
+# rather than creating an action object just to call its `perform` method.
 
 
-class BumpAction(ActionWithDirection):
-    def perform(self) -> None:
-        if self.target_actor:
-            return MeleeAction(self.entity, self.dx, self.dy).perform()
+def perform_melee(entity: Actor, dx: int, dy: int) -> None:
+    """Attack the actor at the given offset from `entity`."""
+    engine = entity.gamemap.engine
+    target = engine.game_map.get_actor_at_location(entity.x + dx, entity.y + dy)
+    if not target:
+        raise exceptions.Impossible("Nothing to attack.")
 
-        else:
-            return MovementAction(self.entity, self.dx, self.dy).perform()
+    add_message = engine.message_log.add_message
+    target_fighter = target.fighter
+    damage = entity.fighter.power - target_fighter.defense
+
+    attack_desc = f"{entity.name.capitalize()} attacks {target.name}"
+    if entity is engine.player:
+        attack_color = color.player_atk
+    else:
+        attack_color = color.enemy_atk
+
+    if damage > 0:
+        add_message(f"{attack_desc} for {damage} hit points.", attack_color)
+        target_fighter.hp -= damage
+    else:
+        add_message(f"{attack_desc} but does no damage.", attack_color)
+
+
+def perform_movement(entity: Actor, dx: int, dy: int) -> None:
+    """Move `entity` by the given offset if the destination is free."""
+    dest_x, dest_y = entity.x + dx, entity.y + dy
+    game_map = entity.gamemap
+
+    if not (
+        0 <= dest_x < game_map.width and 0 <= dest_y < game_map.height
+    ) or not game_map.passable[dest_x, dest_y]:
+        # Destination is out of bounds, or blocked by a tile or an entity.
+        raise exceptions.Impossible("That way is blocked.")
+
+    game_map.move_entity(entity, dest_x, dest_y)
+
+
+def perform_bump(entity: Actor, dx: int, dy: int) -> None:
+    """Attack the actor at the given offset from `entity`, otherwise move there."""
+    if entity.gamemap.get_actor_at_location(entity.x + dx, entity.y + dy):
+        perform_melee(entity, dx, dy)
+    else:
+        perform_movement(entity, dx, dy)
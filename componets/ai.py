@@ -3,35 +3,40 @@ from __future__ import annotations
 import random
 from typing import List, Optional, Tuple, TYPE_CHECKING
 
-import numpy as np  # type: ignore
 import tcod
 
-from actions import Action, BumpAction, MeleeAction, MovementAction, WaitAction
+from actions import Action, perform_bump, perform_melee, perform_movement
 
 if TYPE_CHECKING:
     from entity import Actor
 
 
 class BaseAI(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         raise NotImplementedError()
 
+    def clone(self, entity: Actor) -> BaseAI:
+        """Return a copy of this AI for `entity`, a clone of this AI's actor.
+
+        Per-actor state such as a cached path is not copied.
+        """
+        return type(self)(entity)
+
     def get_path_to(self, dest_x: int, dest_y: int) -> List[Tuple[int, int]]:
         """Compute and return a path to the target position.
 
         If there is no valid path then returns an empty list.
         """
-        # Copy the walkable array.
-        cost = np.array(self.entity.gamemap.tiles["walkable"], dtype=np.int8)
-
-        for entity in self.entity.gamemap.entities:
-            # Check that an enitiy blocks movement and the cost isn't zero (blocking.)
-            if entity.blocks_movement and cost[entity.x, entity.y]:
-                # Add to the cost of a blocked position.
-                # A lower number means more enemies will crowd behind each other in
-                # hallways.  A higher number means enemies will take longer paths in
-                # order to surround the player.
-                cost[entity.x, entity.y] += 10
+        gamemap = self.entity.gamemap
+        walk_cost = gamemap.walk_cost
+
+        # Add to the cost of walkable positions occupied by blocking entities.
+        # A lower number means more enemies will crowd behind each other in
+        # hallways.  A higher number means enemies will take longer paths in
+        # order to surround the player.
+        cost = walk_cost + walk_cost * gamemap.blocker_count * 10
 
         # Create a graph from the cost array and pass that graph to a new pathfinder.
         graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=3)
@@ -47,9 +52,27 @@ class BaseAI(Action):
 
 
 class HostileEnemy(BaseAI):
+    __slots__ = ("path", "path_key")
+
     def __init__(self, entity: Actor):
         super().__init__(entity)
         self.path: List[Tuple[int, int]] = []
+        # The goal and map version which `path` was computed for.
+        self.path_key: Optional[Tuple[Tuple[int, int], int]] = None
+
+    def is_path_valid(self, goal: Tuple[int, int]) -> bool:
+        """Return True if the current path can still be followed to `goal`."""
+        gamemap = self.entity.gamemap
+        if not self.path or self.path_key != (goal, gamemap.map_version):
+            return False
+
+        next_x, next_y = self.path[0]
+        if max(abs(next_x - self.entity.x), abs(next_y - self.entity.y)) != 1:
+            return False  # A previous step failed and the path was left behind.
+
+        # The steps before the goal must not have been blocked since.
+        passable = gamemap.passable
+        return all(passable[x, y] for x, y in self.path[:-1])
 
     def perform(self) -> None:
         target = self.engine.player
@@ -59,17 +82,20 @@ class HostileEnemy(BaseAI):
 
         if self.engine.game_map.visible[self.entity.x, self.entity.y]:
             if distance <= 1:
-                return MeleeAction(self.entity, dx, dy).perform()
+                return perform_melee(self.entity, dx, dy)
 
-            self.path = self.get_path_to(target.x, target.y)
+            goal = target.x, target.y
+            if not self.is_path_valid(goal):
+                self.path = self.get_path_to(*goal)
+                self.path_key = goal, self.entity.gamemap.map_version
 
         if self.path:
             dest_x, dest_y = self.path.pop(0)
-            return MovementAction(
+            return perform_movement(
                 self.entity, dest_x - self.entity.x, dest_y - self.entity.y,
-            ).perform()
+            )
 
-        return WaitAction(self.entity).perform()
+        return None  # Wait.
 
 
 class ConfusedEnemy(BaseAI):
@@ -78,6 +104,8 @@ class ConfusedEnemy(BaseAI):
     If an actor occupies a tile it is randomly moving into, it will attack.
     """
 
+    __slots__ = ("previous_ai", "turns_remaining")
+
     def __init__(
         self, entity: Actor, previous_ai: Optional[BaseAI], turns_remaining: int
     ):
@@ -86,6 +114,14 @@ class ConfusedEnemy(BaseAI):
         self.previous_ai = previous_ai
         self.turns_remaining = turns_remaining
 
+    def clone(self, entity: Actor) -> ConfusedEnemy:
+        previous_ai = self.previous_ai
+        return ConfusedEnemy(
+            entity,
+            None if previous_ai is None else previous_ai.clone(entity),
+            self.turns_remaining,
+        )
+
     def perform(self) -> None:
         # Revert the AI back to the original state if the effect has run its course.
         if self.turns_remaining <= 0:
@@ -112,4 +148,4 @@ class ConfusedEnemy(BaseAI):
 
             # The actor will either try to move or attack in the chosen random direction.
             # Its possible the actor will just bump into the wall, wasting a turn.
-            return BumpAction(self.entity, direction_x, direction_y,).perform()
+            return perform_bump(self.entity, direction_x, direction_y)
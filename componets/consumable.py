@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 
 class Consumable(BaseComponent):
+    __slots__ = ()
+
     parent: Item
 
     def get_action(self, consumer: Actor) -> Optional[ActionOrHandler]:
@@ -41,6 +43,8 @@ class Consumable(BaseComponent):
 
 
 class ConfusionConsumable(Consumable):
+    __slots__ = ("number_of_turns",)
+
     def __init__(self, number_of_turns: int):
         self.number_of_turns = number_of_turns
 
@@ -56,8 +60,9 @@ class ConfusionConsumable(Consumable):
     def activate(self, action: actions.ItemAction) -> None:
         consumer = action.entity
         target = action.target_actor
+        target_x, target_y = action.target_xy
 
-        if not self.engine.game_map.visible[action.target_xy]:
+        if not self.engine.game_map.visible[target_x, target_y]:
             raise Impossible("You cannot target an area that you cannot see.")
         if not target:
             raise Impossible("You must select an enemy to target.")
@@ -75,6 +80,8 @@ class ConfusionConsumable(Consumable):
 
 
 class FireballDamageConsumable(Consumable):
+    __slots__ = ("damage", "radius")
+
     def __init__(self, damage: int, radius: int):
         self.damage = damage
         self.radius = radius
@@ -90,26 +97,30 @@ class FireballDamageConsumable(Consumable):
         )
 
     def activate(self, action: actions.ItemAction) -> None:
-        target_xy = action.target_xy
+        target_x, target_y = action.target_xy
 
-        if not self.engine.game_map.visible[target_xy]:
+        if not self.engine.game_map.visible[target_x, target_y]:
             raise Impossible("You cannot target an area that you cannot see.")
 
-        targets_hit = False
-        for actor in self.engine.game_map.actors:
-            if actor.distance(*target_xy) <= self.radius:
-                self.engine.message_log.add_message(
-                    f"The {actor.name} is engulfed in a fiery explosion, taking {self.damage} damage!"
-                )
-                actor.fighter.take_damage(self.damage)
-                targets_hit = True
-
-        if not targets_hit:
+        actors_hit = self.engine.game_map.get_actors_in_radius(
+            target_x, target_y, self.radius
+        )
+        if not actors_hit:
             raise Impossible("There are no targets in the radius.")
+
+        names = ", ".join(actor.name for actor in actors_hit)
+        verb = "is" if len(actors_hit) == 1 else "are"
+        self.engine.message_log.add_message(
+            f"The {names} {verb} engulfed in a fiery explosion, taking {self.damage} damage!"
+        )
+        for actor in actors_hit:
+            actor.fighter.take_damage(self.damage)
         self.consume()
 
 
 class HealingConsumable(Consumable):
+    __slots__ = ("amount",)
+
     def __init__(self, amount: int):
         self.amount = amount
 
@@ -128,6 +139,8 @@ class HealingConsumable(Consumable):
 
 
 class LightningDamageConsumable(Consumable):
+    __slots__ = ("damage", "maximum_range")
+
     def __init__(self, damage: int, maximum_range: int):
         self.damage = damage
         self.maximum_range = maximum_range
@@ -135,15 +148,16 @@ class LightningDamageConsumable(Consumable):
     def activate(self, action: actions.ItemAction) -> None:
         consumer = action.entity
         target = None
-        closest_distance = self.maximum_range + 1.0
+        # Compare squared distances, as only the closest actor matters.
+        closest_distance_sq = (self.maximum_range + 1) ** 2
 
         for actor in self.engine.game_map.actors:
             if actor is not consumer and self.parent.gamemap.visible[actor.x, actor.y]:
-                distance = consumer.distance(actor.x, actor.y)
+                distance_sq = consumer.distance_sq(actor.x, actor.y)
 
-                if distance < closest_distance:
+                if distance_sq < closest_distance_sq:
                     target = actor
-                    closest_distance = distance
+                    closest_distance_sq = distance_sq
 
         if target:
             self.engine.message_log.add_message(
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class Equipment(BaseComponent):
+    __slots__ = ("weapon", "armor")
+
     parent: Actor
 
     def __init__(self, weapon: Optional[Item] = None, armor: Optional[Item] = None):
@@ -60,6 +62,7 @@ class Equipment(BaseComponent):
             self.unequip_from_slot(slot, add_message)
 
         setattr(self, slot, item)
+        self.parent.fighter.update_stats()
 
         if add_message:
             self.equip_message(item.name)
@@ -71,6 +74,7 @@ class Equipment(BaseComponent):
             self.unequip_message(current_item.name)
 
         setattr(self, slot, None)
+        self.parent.fighter.update_stats()
 
     def toggle_equip(self, equippable_item: Item, add_message: bool = True) -> None:
         if (
@@ -11,13 +11,25 @@ if TYPE_CHECKING:
 
 
 class Fighter(BaseComponent):
+    __slots__ = (
+        "max_hp",
+        "_hp",
+        "_base_defense",
+        "_base_power",
+        "defense",
+        "power",
+    )
+
     parent: Actor
 
     def __init__(self, hp: int, base_defense: int, base_power: int):
         self.max_hp = hp
         self._hp = hp
-        self.base_defense = base_defense
-        self.base_power = base_power
+        self._base_defense = base_defense
+        self._base_power = base_power
+        # Totals including equipment bonuses, kept current by `update_stats`.
+        self.defense = base_defense
+        self.power = base_power
 
     @property
     def hp(self) -> int:
@@ -30,12 +42,27 @@ class Fighter(BaseComponent):
             self.die()
 
     @property
-    def defense(self) -> int:
-        return self.base_defense + self.defense_bonus
+    def base_defense(self) -> int:
+        return self._base_defense
+
+    @base_defense.setter
+    def base_defense(self, value: int) -> None:
+        self._base_defense = value
+        self.update_stats()
 
     @property
-    def power(self) -> int:
-        return self.base_power + self.power_bonus
+    def base_power(self) -> int:
+        return self._base_power
+
+    @base_power.setter
+    def base_power(self, value: int) -> None:
+        self._base_power = value
+        self.update_stats()
+
+    def update_stats(self) -> None:
+        """Recompute `defense` and `power` after a base stat or equipment change."""
+        self.defense = self._base_defense + self.defense_bonus
+        self.power = self._base_power + self.power_bonus
 
     @property
     def defense_bonus(self) -> int:
@@ -52,23 +79,29 @@ class Fighter(BaseComponent):
             return 0
 
     def die(self) -> None:
-        if self.engine.player is self.parent:
+        actor = self.parent
+        gamemap = actor.gamemap
+        engine = gamemap.engine
+        if engine.player is actor:
             death_message = "You died!"
             death_message_color = color.player_die
         else:
-            death_message = f"{self.parent.name} is dead!"
+            death_message = f"{actor.name} is dead!"
             death_message_color = color.enemy_die
 
-        self.parent.char = "%"
-        self.parent.color = (191, 0, 0)
-        self.parent.blocks_movement = False
-        self.parent.ai = None
-        self.parent.name = f"remains of {self.parent.name}"
-        self.parent.render_order = RenderOrder.CORPSE
+        # Re-register the remains so the map picks up that they no longer block.
+        gamemap.remove_entity(actor)
+        actor.char = "%"
+        actor.color = (191, 0, 0)
+        actor.blocks_movement = False
+        actor.ai = None
+        actor.name = f"remains of {actor.name}"
+        actor.render_order = RenderOrder.CORPSE
+        gamemap.add_entity(actor)
 
-        self.engine.message_log.add_message(death_message, death_message_color)
+        engine.message_log.add_message(death_message, death_message_color)
 
-        self.engine.player.level.add_xp(self.parent.level.xp_given)
+        engine.player.level.add_xp(actor.level.xp_given)
 
     def heal(self, amount: int) -> int:
         if self.hp == self.max_hp:
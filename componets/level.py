@@ -9,6 +9,14 @@ if TYPE_CHECKING:
 
 
 class Level(BaseComponent):
+    __slots__ = (
+        "current_level",
+        "current_xp",
+        "level_up_base",
+        "level_up_factor",
+        "xp_given",
+    )
+
     parent: Actor
 
     def __init__(
@@ -39,12 +47,11 @@ class Level(BaseComponent):
 
         self.current_xp += xp
 
-        self.engine.message_log.add_message(f"You gain {xp} experience points.")
+        add_message = self.engine.message_log.add_message
+        add_message(f"You gain {xp} experience points.")
 
         if self.requires_level_up:
-            self.engine.message_log.add_message(
-                f"You advance to level {self.current_level + 1}!"
-            )
+            add_message(f"You advance to level {self.current_level + 1}!")
 
     def increase_level(self) -> None:
         self.current_xp -= self.experience_to_next_level
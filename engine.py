@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import lzma
+import os
 import pickle
-from typing import TYPE_CHECKING
+import struct
+import zlib
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
+import numpy as np  # type: ignore
 from tcod.console import Console
-from tcod.map import compute_fov
 
 import exceptions
 from message_log import MessageLog
@@ -15,6 +18,20 @@ if TYPE_CHECKING:
     from entity import Actor
     from game_map import GameMap, GameWorld
 
+FOV_RADIUS = 8  # How far the player can see, in tiles.
+
+# A save file starts with a magic string and format version, the size of the
+# LZMA compressed pickle and the number of out-of-band buffers, followed by the
+# compressed and uncompressed sizes of each buffer.  Then comes the compressed
+# pickle and finally the zlib compressed buffers, which hold the NumPy arrays.
+SAVE_MAGIC = b"FGSV"
+SAVE_VERSION = 2
+SAVE_HEADER = struct.Struct("<4sHQI")
+SAVE_BUFFER_SIZE = struct.Struct("<QQ")
+# The arrays are mostly runs of the same few values, even the fastest zlib
+# level shrinks them to a fraction of their size.
+SAVE_BUFFER_COMPRESSION = 1
+
 
 class Engine:
     game_map: GameMap
@@ -24,24 +41,46 @@ class Engine:
         self.message_log = MessageLog()
         self.mouse_location = (0, 0)
         self.player = player
+        # The map, player position and map version the FOV was last computed for.
+        self._fov_key: Optional[Tuple[GameMap, int, int, int]] = None
 
     def handle_enemy_turns(self) -> None:
-        for entity in set(self.game_map.actors) - {self.player}:
-            if entity.ai:
-                try:
-                    entity.ai.perform()
-                except exceptions.Impossible:
-                    pass  # Ignore impossible action exceptions from AI.
+        player = self.player
+        for entity in self.game_map.actors:
+            ai = entity.ai
+            if ai is None or entity is player:
+                continue  # Killed earlier this turn, or not an enemy.
+            try:
+                ai.perform()
+            except exceptions.Impossible:
+                pass  # Ignore impossible action exceptions from AI.
+            if not player.is_alive:
+                break  # The game is over, the remaining enemies can't act.
 
     def update_fov(self) -> None:
         """Recompute the visible area based on the players point of view."""
-        self.game_map.visible[:] = compute_fov(
-            self.game_map.tiles["transparent"],
-            (self.player.x, self.player.y),
-            radius=8,
+        fov_key = (
+            self.game_map,
+            self.player.x,
+            self.player.y,
+            self.game_map.map_version,
         )
-        # If a tile is "visible" it should be added to "explored".
-        self.game_map.explored |= self.game_map.visible
+        if fov_key == self._fov_key:
+            return  # Nothing which affects the FOV has changed.
+        self._fov_key = fov_key
+
+        game_map = self.game_map
+        x, y = self.player.x, self.player.y
+        np.copyto(game_map.visible, game_map.compute_fov(x, y, FOV_RADIUS))
+        # If a tile is "visible" it should be added to "explored".  Only the
+        # tiles within the FOV radius of the player can have become visible.
+        window = (
+            slice(max(0, x - FOV_RADIUS), x + FOV_RADIUS + 1),
+            slice(max(0, y - FOV_RADIUS), y + FOV_RADIUS + 1),
+        )
+        explored = game_map.explored[window]
+        np.logical_or(explored, game_map.visible[window], out=explored)
+        game_map.fov_changed()
 
     def render(self, console: Console) -> None:
         self.game_map.render(console)
@@ -67,6 +106,26 @@ class Engine:
 
     def save_as(self, filename: str) -> None:
         """Save this Engine instance as a compressed file."""
-        save_data = lzma.compress(pickle.dumps(self))
-        with open(filename, "wb") as f:
-            f.write(save_data)
+        buffers: List[pickle.PickleBuffer] = []
+        data = lzma.compress(
+            pickle.dumps(self, protocol=5, buffer_callback=buffers.append)
+        )
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        compressed_buffers = [
+            zlib.compress(raw, SAVE_BUFFER_COMPRESSION) for raw in raw_buffers
+        ]
+        # Write to a temporary file first, so that a failed save can't leave a
+        # truncated save file in place of the previous one.
+        temp_filename = f"{filename}.tmp"
+        with open(temp_filename, "wb") as f:
+            f.write(
+                SAVE_HEADER.pack(
+                    SAVE_MAGIC, SAVE_VERSION, len(data), len(compressed_buffers)
+                )
+            )
+            for raw, compressed in zip(raw_buffers, compressed_buffers):
+                f.write(SAVE_BUFFER_SIZE.pack(len(compressed), raw.nbytes))
+            f.write(data)
+            for compressed in compressed_buffers:
+                f.write(compressed)
+        os.replace(temp_filename, filename)
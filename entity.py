@@ -24,6 +24,17 @@ class Entity:
     A generic object to represent players, enemies, items, etc.
     """
 
+    __slots__ = (
+        "x",
+        "y",
+        "char",
+        "color",
+        "name",
+        "blocks_movement",
+        "render_order",
+        "parent",
+    )
+
     parent: Union[GameMap, Inventory]
 
     def __init__(
@@ -47,31 +58,43 @@ class Entity:
         if parent:
             # If parent isn't provided now then it will be set later.
             self.parent = parent
-            parent.entities.add(self)
+            parent.add_entity(self)
 
     @property
     def gamemap(self) -> GameMap:
         return self.parent.gamemap
 
+    def clone(self: T) -> T:
+        """Return a copy of this entity with its own copies of its components.
+
+        Faster than `copy.deepcopy`, as only the mutable parts are copied.
+        """
+        return copy.copy(self)
+
     def spawn(self: T, gamemap: GameMap, x: int, y: int) -> T:
         """Spawn a copy of this instance at the given location."""
-        clone = copy.deepcopy(self)
+        clone = self.clone()
         clone.x = x
         clone.y = y
         clone.parent = gamemap
-        gamemap.entities.add(clone)
+        gamemap.add_entity(clone)
         return clone
 
     def place(self, x: int, y: int, gamemap: Optional[GameMap] = None) -> None:
         """Place this entitiy at a new location.  Handles moving across GameMaps."""
-        self.x = x
-        self.y = y
+        on_map = hasattr(self, "parent") and self.parent is self.gamemap
         if gamemap:
-            if hasattr(self, "parent"):  # Possibly uninitialized.
-                if self.parent is self.gamemap:
-                    self.gamemap.entities.remove(self)
+            if on_map:
+                self.gamemap.remove_entity(self)
+            self.x = x
+            self.y = y
             self.parent = gamemap
-            gamemap.entities.add(self)
+            gamemap.add_entity(self)
+        elif on_map:
+            self.gamemap.move_entity(self, x, y)
+        else:
+            self.x = x
+            self.y = y
 
     def distance(self, x: int, y: int) -> float:
         """
@@ -79,13 +102,27 @@ class Entity:
         """
         return math.sqrt((x - self.x) ** 2 + (y - self.y) ** 2)
 
+    def distance_sq(self, x: int, y: int) -> int:
+        """
+        Return the squared distance to the given (x, y) coordinate.
+
+        Cheaper than `distance` when only comparing distances.
+        """
+        dx = x - self.x
+        dy = y - self.y
+        return dx * dx + dy * dy
+
     def move(self, dx: int, dy: int) -> None:
         # Move the entity by a given amount
-        self.x += dx
-        self.y += dy
+        self.gamemap.move_entity(self, self.x + dx, self.y + dy)
 
 
 class Actor(Entity):
+    __slots__ = ("ai", "equipment", "fighter", "inventory", "level")
+
+    # An actor's parent is always the map it is on.
+    parent: GameMap
+
     def __init__(
         self,
         *,
@@ -124,13 +161,49 @@ class Actor(Entity):
         self.level = level
         self.level.parent = self
 
+        # Include the bonuses of any equipment the actor starts with.
+        self.fighter.update_stats()
+
+    def clone(self) -> Actor:
+        clone = super().clone()
+        clone.ai = None if self.ai is None else self.ai.clone(clone)
+
+        clone.fighter = copy.copy(self.fighter)
+        clone.level = copy.copy(self.level)
+
+        # Copy the carried items, then point the equipment at the copies.
+        item_clones = {item: item.clone() for item in self.inventory.items}
+        clone.inventory = copy.copy(self.inventory)
+        clone.inventory.items = list(item_clones.values())
+        for item in clone.inventory.items:
+            item.parent = clone.inventory
+        clone.equipment = copy.copy(self.equipment)
+        for slot in ("weapon", "armor"):
+            item = getattr(self.equipment, slot)
+            if item is not None:
+                item_clone = item_clones.get(item)
+                if item_clone is None:  # Equipped without being carried.
+                    item_clone = item.clone()
+                    item_clone.parent = clone.inventory
+                setattr(clone.equipment, slot, item_clone)
+
+        for component in (clone.equipment, clone.fighter, clone.inventory, clone.level):
+            component.parent = clone
+        return clone
+
+    @property
+    def gamemap(self) -> GameMap:
+        return self.parent
+
     @property
     def is_alive(self) -> bool:
         """Returns True as long as this actor can perform actions."""
-        return bool(self.ai)
+        return self.ai is not None
 
 
 class Item(Entity):
+    __slots__ = ("consumable", "equippable")
+
     def __init__(
         self,
         *,
@@ -161,3 +234,13 @@ class Item(Entity):
 
         if self.equippable:
             self.equippable.parent = self
+
+    def clone(self) -> Item:
+        clone = super().clone()
+        if self.consumable:
+            clone.consumable = copy.copy(self.consumable)
+            clone.consumable.parent = clone
+        if self.equippable:
+            clone.equippable = copy.copy(self.equippable)
+            clone.equippable.parent = clone
+        return clone
@@ -1,17 +1,32 @@
 from __future__ import annotations
 
-from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 import numpy as np  # type: ignore
 from tcod.console import Console
+import tcod.map
 
 from entity import Actor, Item
+from render_order import RenderOrder
 import tile_types
 
 if TYPE_CHECKING:
     from engine import Engine
     from entity import Entity
 
+# Below this many living actors a plain loop beats building NumPy temporaries.
+MIN_VECTORIZED_ACTORS = 32
+
 
 class GameMap:
     def __init__(
@@ -19,54 +34,296 @@ class GameMap:
     ):
         self.engine = engine
         self.width, self.height = width, height
-        self.entities = set(entities)
-        self.tiles = np.full((width, height), fill_value=tile_types.wall, order="F")
+        self.entities: List[Entity] = []
+        # The entities grouped by render order, in the order they're drawn.
+        self._entities_by_order: Dict[RenderOrder, List[Entity]] = {
+            render_order: [] for render_order in RenderOrder
+        }
+        # The x, y, char and color arrays of each group for drawing them all at
+        # once, None until the next render after the group changes.
+        self._render_arrays: Dict[RenderOrder, Optional[Tuple[np.ndarray, ...]]] = {
+            render_order: None for render_order in RenderOrder
+        }
+        self.tiles = np.full((width, height), fill_value=tile_types.wall)
+        # Contiguous copies of the tile properties, kept in sync with `tiles`.
+        self.walkable = np.ascontiguousarray(self.tiles["walkable"])
+        self.transparent = np.ascontiguousarray(self.tiles["transparent"])
+        # Holds its own copy of `transparent` and the FOV result between calls.
+        self._fov_map = tcod.map.Map(width, height, order="F")
+
+        # Spatial indexes of all entities, the blocking entities, the living
+        # actors and the items.
+        self._entities_at: Dict[Tuple[int, int], List[Entity]] = {}
+        self._blocker_at: Dict[Tuple[int, int], Entity] = {}
+        self._actor_at: Dict[Tuple[int, int], Actor] = {}
+        self._items_at: Dict[Tuple[int, int], List[Item]] = {}
+        # The living actors as rows of parallel arrays, for vectorized queries.
+        # `_actor_refs[i]` is the actor stored in row `i`.  The rows of actors
+        # which died or left are only cleared in `_actor_alive`, so that rows
+        # never move while the actors are being iterated over.
+        self._actor_pos = np.zeros((16, 2), dtype=np.int32)
+        self._actor_alive = np.zeros(16, dtype=bool)
+        self._actor_refs: List[Actor] = []
+        self._actor_rows: Dict[Actor, int] = {}
+        # Number of movement blocking entities standing on each tile.
+        self.blocker_count = np.zeros((width, height), dtype=np.int8)
+        # Built on first use, and rebuilt after `tiles_changed` is called.
+        self._passable: Optional[np.ndarray] = None
+        self._walk_cost: Optional[np.ndarray] = None
+        # Incremented whenever the tiles are edited, for caches derived from them.
+        self.map_version = 0
+
+        # Tiles the player can currently see
+        self.visible = np.full((width, height), fill_value=False, dtype=bool)
+        # Tiles the player has seen before
+        self.explored = np.full((width, height), fill_value=False, dtype=bool)
 
-        self.visible = np.full(
-            (width, height), fill_value=False, order="F"
-        )  # Tiles the player can currently see
-        self.explored = np.full(
-            (width, height), fill_value=False, order="F"
-        )  # Tiles the player has seen before
+        # The blended tile graphics, only blended again after the tiles or the
+        # FOV change.  Indexed [y, x] like the console it is copied to.
+        self._tile_buf = np.empty((height, width), dtype=tile_types.graphic_dt)
+        self._tile_buf_stale = True
 
         self.downstairs_location = (0, 0)
 
+        for entity in entities:
+            self.add_entity(entity)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Leave data derived from the tiles, and scratch buffers, out of saves."""
+        state = self.__dict__.copy()
+        for name in (
+            "_render_arrays",
+            "walkable",
+            "transparent",
+            "_fov_map",
+            "_passable",
+            "_walk_cost",
+            "_tile_buf",
+            "_tile_buf_stale",
+        ):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        width, height = self.width, self.height
+        self._render_arrays = {render_order: None for render_order in RenderOrder}
+        self.walkable = np.empty((width, height), dtype=bool)
+        self.transparent = np.empty((width, height), dtype=bool)
+        self._fov_map = tcod.map.Map(width, height, order="F")
+        self._tile_buf = np.empty((height, width), dtype=tile_types.graphic_dt)
+        self.tiles_changed()
+
     @property
     def gamemap(self) -> GameMap:
         return self
 
     @property
     def actors(self) -> Iterator[Actor]:
-        """Iterate over this maps living actors."""
-        yield from (
-            entity
-            for entity in self.entities
-            if isinstance(entity, Actor) and entity.is_alive
-        )
+        """Iterate over this maps living actors.
+
+        The actors are those alive when the iteration starts.
+        """
+        actor_refs = self._actor_refs
+        for row in np.flatnonzero(self._actor_alive[: len(actor_refs)]):
+            yield actor_refs[row]
 
     @property
     def items(self) -> Iterator[Item]:
-        yield from (entity for entity in self.entities if isinstance(entity, Item))
+        for items in self._items_at.values():
+            yield from items
+
+    @property
+    def passable(self) -> np.ndarray:
+        """Boolean array of the tiles which can be moved into.
+
+        These are the walkable tiles which aren't occupied by a blocking entity.
+        """
+        if self._passable is None:
+            self._passable = self.walkable & (self.blocker_count == 0)
+        return self._passable
+
+    @property
+    def walk_cost(self) -> np.ndarray:
+        """The pathfinding cost of each tile, 1 if walkable and 0 if not.
+
+        Shared by every AI on this map, so it must not be modified.
+        """
+        if self._walk_cost is None:
+            self._walk_cost = self.walkable.astype(np.int8)
+        return self._walk_cost
+
+    def tiles_changed(self) -> None:
+        """Must be called after editing `tiles` so that derived data is rebuilt."""
+        np.copyto(self.walkable, self.tiles["walkable"])
+        np.copyto(self.transparent, self.tiles["transparent"])
+        np.copyto(self._fov_map.transparent, self.transparent)
+        self._passable = None
+        self._walk_cost = None
+        self._tile_buf_stale = True
+        self.map_version += 1
+
+    def fov_changed(self) -> None:
+        """Must be called after editing `visible` or `explored`."""
+        self._tile_buf_stale = True
+
+    def set_tile(self, x: int, y: int, tile: np.ndarray) -> None:
+        """Change a single tile, updating the data derived from it in place."""
+        walkable = bool(tile["walkable"])
+        self.tiles[x, y] = tile
+        self.walkable[x, y] = walkable
+        self.transparent[x, y] = self._fov_map.transparent[x, y] = tile["transparent"]
+        if self._passable is not None:
+            self._passable[x, y] = walkable and not self.blocker_count[x, y]
+        if self._walk_cost is not None:
+            self._walk_cost[x, y] = walkable
+        self._tile_buf_stale = True
+        self.map_version += 1
+
+    def add_entity(self, entity: Entity) -> None:
+        """Add an entity to this map at its current location."""
+        self.entities.append(entity)
+        self._entities_by_order[entity.render_order].append(entity)
+        self._render_arrays[entity.render_order] = None
+        self._index_entity(entity)
+        if isinstance(entity, Actor) and entity.is_alive:
+            self._add_actor_row(entity)
+
+    def remove_entity(self, entity: Entity) -> None:
+        """Remove an entity from this map."""
+        self.entities.remove(entity)
+        self._entities_by_order[entity.render_order].remove(entity)
+        self._render_arrays[entity.render_order] = None
+        if isinstance(entity, Actor) and entity in self._actor_rows:
+            self._actor_alive[self._actor_rows.pop(entity)] = False
+        self._unindex_entity(entity)
+
+    def move_entity(self, entity: Entity, x: int, y: int) -> None:
+        """Move an entity on this map to a new location."""
+        self._unindex_entity(entity)
+        entity.x = x
+        entity.y = y
+        self._index_entity(entity)
+        self._render_arrays[entity.render_order] = None
+        if isinstance(entity, Actor) and entity in self._actor_rows:
+            self._actor_pos[self._actor_rows[entity]] = x, y
+
+    def _add_actor_row(self, actor: Actor) -> None:
+        row = len(self._actor_refs)
+        if row == len(self._actor_pos):
+            self._compact_actor_rows()
+            row = len(self._actor_refs)
+            if row * 2 > len(self._actor_pos):  # Still more than half full.
+                self._actor_pos = np.resize(self._actor_pos, (row * 2, 2))
+                self._actor_alive = np.resize(self._actor_alive, row * 2)
+        self._actor_pos[row] = actor.x, actor.y
+        self._actor_alive[row] = True
+        self._actor_refs.append(actor)
+        self._actor_rows[actor] = row
+
+    def _compact_actor_rows(self) -> None:
+        """Drop the rows of actors which are no longer on this map."""
+        live_rows = np.flatnonzero(self._actor_alive[: len(self._actor_refs)])
+        count = len(live_rows)
+        self._actor_pos[:count] = self._actor_pos[live_rows]
+        self._actor_alive[:count] = True
+        self._actor_alive[count:] = False
+        self._actor_refs = [self._actor_refs[row] for row in live_rows]
+        self._actor_rows = {actor: row for row, actor in enumerate(self._actor_refs)}
+
+    def _get_render_arrays(self, render_order: RenderOrder) -> Tuple[np.ndarray, ...]:
+        render_arrays = self._render_arrays[render_order]
+        if render_arrays is None:
+            entities = self._entities_by_order[render_order]
+            render_arrays = (
+                np.array([entity.x for entity in entities], dtype=np.intp),
+                np.array([entity.y for entity in entities], dtype=np.intp),
+                np.array([ord(entity.char) for entity in entities], dtype=np.int32),
+                np.array([entity.color for entity in entities], dtype=np.uint8),
+            )
+            self._render_arrays[render_order] = render_arrays
+        return render_arrays
+
+    def _index_entity(self, entity: Entity) -> None:
+        x, y = entity.x, entity.y
+        self._entities_at.setdefault((x, y), []).append(entity)
+        if entity.blocks_movement:
+            self._blocker_at.setdefault((x, y), entity)
+            self.blocker_count[x, y] += 1
+            if self._passable is not None:
+                self._passable[x, y] = False
+        if isinstance(entity, Actor) and entity.is_alive:
+            self._actor_at[x, y] = entity
+        if isinstance(entity, Item):
+            self._items_at.setdefault((x, y), []).append(entity)
+
+    def _unindex_entity(self, entity: Entity) -> None:
+        x, y = entity.x, entity.y
+        entities = self._entities_at[x, y]
+        entities.remove(entity)
+        if not entities:
+            del self._entities_at[x, y]
+        if self._actor_at.get((x, y)) is entity:
+            del self._actor_at[x, y]
+        if entity.blocks_movement:
+            if self._blocker_at[x, y] is entity:
+                del self._blocker_at[x, y]
+                # Hand the tile over to any other entity still blocking it.
+                for other in entities:
+                    if other.blocks_movement:
+                        self._blocker_at[x, y] = other
+                        break
+            self.blocker_count[x, y] -= 1
+            if self._passable is not None and not self.blocker_count[x, y]:
+                self._passable[x, y] = self.walkable[x, y]
+        if isinstance(entity, Item):
+            items = self._items_at[x, y]
+            items.remove(entity)
+            if not items:
+                del self._items_at[x, y]
+
+    def get_entities_at_location(self, x: int, y: int) -> Sequence[Entity]:
+        """Return every entity at this location."""
+        return self._entities_at.get((x, y), ())
 
     def get_blocking_entity_at_location(
         self, location_x: int, location_y: int,
     ) -> Optional[Entity]:
-        for entity in self.entities:
-            if (
-                entity.blocks_movement
-                and entity.x == location_x
-                and entity.y == location_y
-            ):
-                return entity
-
-        return None
+        return self._blocker_at.get((location_x, location_y))
 
     def get_actor_at_location(self, x: int, y: int) -> Optional[Actor]:
-        for actor in self.actors:
-            if actor.x == x and actor.y == y:
-                return actor
+        return self._actor_at.get((x, y))
+
+    def get_actors_in_radius(self, x: int, y: int, radius: int) -> List[Actor]:
+        """Return the living actors within `radius` tiles of this location."""
+        radius_sq = radius * radius
+        if len(self._actor_rows) < MIN_VECTORIZED_ACTORS:
+            # `_actor_rows` holds the living actors in row order.
+            return [
+                actor
+                for actor in self._actor_rows
+                if actor.distance_sq(x, y) <= radius_sq
+            ]
+        count = len(self._actor_refs)
+        positions = self._actor_pos[:count]
+        dx = positions[:, 0] - x
+        dy = positions[:, 1] - y
+        hits = np.flatnonzero(
+            self._actor_alive[:count] & (dx * dx + dy * dy <= radius_sq)
+        )
+        return [self._actor_refs[i] for i in hits]
 
-        return None
+    def get_items_at_location(self, x: int, y: int) -> Sequence[Item]:
+        """Return the items lying at this location, in the order they were dropped."""
+        return self._items_at.get((x, y), ())
+
+    def compute_fov(self, x: int, y: int, radius: int) -> np.ndarray:
+        """Return the tiles visible from this location.
+
+        The result is overwritten by the next call.
+        """
+        self._fov_map.compute_fov(x, y, radius=radius)
+        return self._fov_map.fov
 
     def in_bounds(self, x: int, y: int) -> bool:
         """Return True if x and y are inside of the bounds of this map."""
@@ -80,21 +337,29 @@ class GameMap:
         If it isn't, but it's in the "explored" array, then draw it with the "dark" colors.
         Otherwise, the default is "SHROUD".
         """
-        console.tiles_rgb[0 : self.width, 0 : self.height] = np.select(
-            condlist=[self.visible, self.explored],
-            choicelist=[self.tiles["light"], self.tiles["dark"]],
-            default=tile_types.SHROUD,
-        )
-
-        entities_sorted_for_rendering = sorted(
-            self.entities, key=lambda x: x.render_order.value
-        )
+        visible = self.visible
+        tile_buf = self._tile_buf
+        if self._tile_buf_stale:
+            tiles = self.tiles
+            np.copyto(tile_buf, tile_types.SHROUD)
+            np.copyto(tile_buf, tiles["dark"].T, where=self.explored.T)
+            np.copyto(tile_buf, tiles["light"].T, where=visible.T)
+            self._tile_buf_stale = False
+        console_tiles = console.tiles_rgb
+        console_tiles[0 : self.height, 0 : self.width] = tile_buf
 
-        for entity in entities_sorted_for_rendering:
-            if self.visible[entity.x, entity.y]:
-                console.print(
-                    x=entity.x, y=entity.y, string=entity.char, fg=entity.color
-                )
+        # Draw the visible entities of each render order over the last.
+        console_ch = console_tiles["ch"]
+        console_fg = console_tiles["fg"]
+        get_render_arrays = self._get_render_arrays
+        for render_order, entities in self._entities_by_order.items():
+            if not entities:
+                continue
+            x, y, ch, fg = get_render_arrays(render_order)
+            shown = visible[x, y]
+            x, y = x[shown], y[shown]
+            console_ch[y, x] = ch[shown]
+            console_fg[y, x] = fg[shown]
 
 
 class GameWorld:
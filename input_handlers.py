@@ -62,6 +62,17 @@ CONFIRM_KEYS = {
     tcod.event.K_KP_ENTER,
 }
 
+# The `ev_*` method for each common event class, so that dispatching these
+# doesn't need to build the method name from `event.type` every time.
+EVENT_METHODS = {
+    tcod.event.Quit: "ev_quit",
+    tcod.event.KeyDown: "ev_keydown",
+    tcod.event.KeyUp: "ev_keyup",
+    tcod.event.MouseMotion: "ev_mousemotion",
+    tcod.event.MouseButtonDown: "ev_mousebuttondown",
+    tcod.event.MouseButtonUp: "ev_mousebuttonup",
+}
+
 ActionOrHandler = Union[Action, "BaseEventHandler"]
 """An event handler return value which can trigger an action or switch active handlers.
 
@@ -72,6 +83,13 @@ MainGameEventHandler will become the active handler.
 
 
 class BaseEventHandler(tcod.event.EventDispatch[ActionOrHandler]):
+    def dispatch(self, event: tcod.event.Event) -> Optional[ActionOrHandler]:
+        """Send an event to its `ev_*` method."""
+        method_name = EVENT_METHODS.get(type(event))
+        if method_name is None:
+            return super().dispatch(event)
+        return getattr(self, method_name)(event)
+
     def handle_events(self, event: tcod.event.Event) -> BaseEventHandler:
         """Handle an event and return the next active event handler."""
         state = self.dispatch(event)
@@ -418,8 +436,8 @@ class SelectIndexHandler(AskUserEventHandler):
         """Highlight the tile under the cursor."""
         super().on_render(console)
         x, y = self.engine.mouse_location
-        console.tiles_rgb["bg"][x, y] = color.white
-        console.tiles_rgb["fg"][x, y] = color.black
+        console.tiles_rgb["bg"][y, x] = color.white
+        console.tiles_rgb["fg"][y, x] = color.black
 
     def ev_keydown(self, event: tcod.event.KeyDown) -> Optional[ActionOrHandler]:
         """Check for key movement or confirmation keys."""
@@ -560,8 +578,10 @@ class MainGameEventHandler(EventHandler):
 class GameOverEventHandler(EventHandler):
     def on_quit(self) -> None:
         """Handle exiting out of a finished game."""
-        if os.path.exists("savegame.sav"):
+        try:
             os.remove("savegame.sav")  # Deletes the active save file.
+        except FileNotFoundError:
+            pass  # There was no save file to delete.
         raise exceptions.QuitWithoutSaving()  # Avoid saving a finished game.
 
     def ev_quit(self, event: tcod.event.Quit) -> None:
@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
+import atexit
+import logging
+import logging.handlers
+import queue
 import traceback
+from typing import Iterable, List, Optional
 
 import tcod
 
@@ -9,6 +14,22 @@ import setup_game
 import input_handlers
 
 
+logger = logging.getLogger(__name__)
+
+
+def start_logging() -> None:
+    """Write log records to stderr from a background thread.
+
+    Records are queued by the logging calls, so errors in the game loop don't
+    wait on stderr.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    atexit.register(listener.stop)  # Flush the queued records on exit.
+
+
 def save_game(handler: input_handlers.BaseEventHandler, filename: str) -> None:
     """If the current event handler has an active Engine then save it."""
     if isinstance(handler, input_handlers.EventHandler):
@@ -16,6 +37,23 @@ def save_game(handler: input_handlers.BaseEventHandler, filename: str) -> None:
         print("Game saved.")
 
 
+def coalesce_mouse_motion(
+    events: Iterable[tcod.event.Event],
+) -> List[tcod.event.Event]:
+    """Return the events with each run of mouse motion reduced to its last event."""
+    coalesced: List[tcod.event.Event] = []
+    for event in events:
+        if (
+            isinstance(event, tcod.event.MouseMotion)
+            and coalesced
+            and isinstance(coalesced[-1], tcod.event.MouseMotion)
+        ):
+            coalesced[-1] = event
+        else:
+            coalesced.append(event)
+    return coalesced
+
+
 def main() -> None:
     screen_width = 80
     screen_height = 50
@@ -24,6 +62,8 @@ def main() -> None:
         "dejavu10x10_gs_tc.png", 32, 8, tcod.tileset.CHARMAP_TCOD
     )
 
+    start_logging()
+
     handler: input_handlers.BaseEventHandler = setup_game.MainMenu()
 
     with tcod.context.new_terminal(
@@ -33,23 +73,32 @@ def main() -> None:
         title="Fantasy-Game",
         vsync=True,
     ) as context:
-        root_console = tcod.Console(screen_width, screen_height, order="F")
+        root_console = tcod.Console(screen_width, screen_height, order="C")
+        # The last frame presented, to skip presenting identical frames.
+        last_frame: Optional[bytes] = None
         try:
             while True:
                 root_console.clear()
                 handler.on_render(console=root_console)
-                context.present(root_console)
+                frame = root_console.rgb.tobytes()
+                if frame != last_frame:
+                    context.present(root_console)
+                    last_frame = frame
 
                 try:
-                    for event in tcod.event.wait():
+                    for event in coalesce_mouse_motion(tcod.event.wait()):
+                        if isinstance(event, tcod.event.WindowEvent):
+                            last_frame = None  # The window must be redrawn.
                         context.convert_event(event)
                         handler = handler.handle_events(event)
                 except Exception:  # Handle exceptions in game.
-                    traceback.print_exc()  # Print error to stderr.
+                    # Format the traceback once, for both the log and the game.
+                    error_text = traceback.format_exc()
+                    logger.error("Error in the game loop:\n%s", error_text)
                     # Then print the error to the message log.
                     if isinstance(handler, input_handlers.EventHandler):
                         handler.engine.message_log.add_message(
-                            traceback.format_exc(), color.error
+                            error_text, color.error
                         )
         except exceptions.QuitWithoutSaving:
             raise
@@ -1,3 +1,4 @@
+import functools
 from typing import Iterable, List, Reversible, Tuple
 import textwrap
 
@@ -6,6 +7,12 @@ import tcod
 import color
 
 
+@functools.lru_cache(maxsize=None)
+def get_text_wrapper(width: int) -> textwrap.TextWrapper:
+    """Return a shared TextWrapper for this width, rather than making one per line."""
+    return textwrap.TextWrapper(width, expand_tabs=True)
+
+
 class Message:
     def __init__(self, text: str, fg: Tuple[int, int, int]):
         self.plain_text = text
@@ -52,10 +59,9 @@ class MessageLog:
     @staticmethod
     def wrap(string: str, width: int) -> Iterable[str]:
         """Return a wrapped text message."""
+        wrapper = get_text_wrapper(width)
         for line in string.splitlines():  # Handle newlines in messages.
-            yield from textwrap.wrap(
-                line, width, expand_tabs=True,
-            )
+            yield from wrapper.wrap(line)
 
     @classmethod
     def render_messages(
@@ -130,7 +130,7 @@ def place_entities(room: RectangularRoom, dungeon: GameMap, floor_number: int,)
         x = random.randint(room.x1 + 1, room.x2 - 1)
         y = random.randint(room.y1 + 1, room.y2 - 1)
 
-        if not any(entity.x == x and entity.y == y for entity in dungeon.entities):
+        if not dungeon.get_entities_at_location(x, y):
             entity.spawn(dungeon, x, y)
 
 
@@ -164,7 +164,7 @@ def generate_dungeon(
 ) -> GameMap:
     """Generate a new dungeon map."""
     player = engine.player
-    dungeon = GameMap(engine, map_width, map_height, entities=[player])
+    dungeon = GameMap(engine, map_width, map_height)
 
     rooms: List[RectangularRoom] = []
 
@@ -194,16 +194,18 @@ def generate_dungeon(
         else:  # All rooms after the first.
             # Dig out a tunnel between this room and the previous one.
             for x, y in tunnel_between(rooms[-1].center, new_room.center):
-                dungeon.tiles[x, y] = tile_types.floor
+                dungeon.set_tile(x, y, tile_types.floor)
 
             center_of_last_room = new_room.center
 
         place_entities(new_room, dungeon, engine.game_world.current_floor)
 
-        dungeon.tiles[center_of_last_room] = tile_types.down_stairs
+        dungeon.set_tile(*center_of_last_room, tile_types.down_stairs)
         dungeon.downstairs_location = center_of_last_room
 
         # Finally, append the new room to the list.
         rooms.append(new_room)
 
+    dungeon.tiles_changed()
+
     return dungeon
@@ -1,7 +1,7 @@
-from enum import auto, Enum
+from enum import auto, IntEnum
 
 
-class RenderOrder(Enum):
+class RenderOrder(IntEnum):
     CORPSE = auto()
     ITEM = auto()
     ACTOR = auto()
@@ -1,21 +1,29 @@
 """Handle the loading and initialization of game sessions."""
 from __future__ import annotations
 
-import copy
+import functools
+import logging
 import lzma
 import pickle
-import traceback
+import zlib
 from typing import Optional
 
 import tcod
 
 import color
-from engine import Engine
+from engine import Engine, SAVE_BUFFER_SIZE, SAVE_HEADER, SAVE_MAGIC, SAVE_VERSION
 import entity_factories
 from game_map import GameWorld
 import input_handlers
 
 
+logger = logging.getLogger(__name__)
+
+# The main menu keys, resolved once rather than on every key press.
+QUIT_KEYS = {tcod.event.K_q, tcod.event.K_ESCAPE}
+CONTINUE_KEY = tcod.event.K_c
+NEW_GAME_KEY = tcod.event.K_n
+
 # Load the background image and remove the alpha channel.
 background_image = tcod.image.load("menu_background.png")[:, :, :3]
 
@@ -29,7 +37,7 @@ def new_game() -> Engine:
     room_min_size = 6
     max_rooms = 30
 
-    player = copy.deepcopy(entity_factories.player)
+    player = entity_factories.player.clone()
 
     engine = Engine(player=player)
 
@@ -49,8 +57,8 @@ def new_game() -> Engine:
         "Hello and welcome, traveller to yet another dungeon!", color.welcome_text
     )
 
-    dagger = copy.deepcopy(entity_factories.dagger)
-    leather_armor = copy.deepcopy(entity_factories.leather_armor)
+    dagger = entity_factories.dagger.clone()
+    leather_armor = entity_factories.leather_armor.clone()
 
     dagger.parent = player.inventory
     leather_armor.parent = player.inventory
@@ -67,61 +75,90 @@ def new_game() -> Engine:
 def load_game(filename: str) -> Engine:
     """Load an Engine instance from a file."""
     with open(filename, "rb") as f:
-        engine = pickle.loads(lzma.decompress(f.read()))
+        header = f.read(SAVE_HEADER.size)
+        if len(header) < SAVE_HEADER.size or not header.startswith(SAVE_MAGIC):
+            raise ValueError("This is not a save file of this game.")
+        _, version, data_size, buffer_count = SAVE_HEADER.unpack(header)
+        if version != SAVE_VERSION:
+            raise ValueError(f"This save file has an unsupported version ({version}).")
+        buffer_sizes = [
+            SAVE_BUFFER_SIZE.unpack(f.read(SAVE_BUFFER_SIZE.size))
+            for _ in range(buffer_count)
+        ]
+        data = lzma.decompress(f.read(data_size))
+        # Decompress into bytearrays so that the arrays loaded from them are
+        # writable.
+        buffers = [
+            bytearray(zlib.decompress(f.read(compressed_size), bufsize=size))
+            for compressed_size, size in buffer_sizes
+        ]
+    engine = pickle.loads(data, buffers=buffers)
     assert isinstance(engine, Engine)
     return engine
 
 
-class MainMenu(input_handlers.BaseEventHandler):
-    """Handle the main menu rendering and input."""
+@functools.lru_cache(maxsize=1)
+def get_menu_console(width: int, height: int) -> tcod.Console:
+    """Return a console with the main menu drawn on it.
 
-    def on_render(self, console: tcod.Console) -> None:
-        """Render the main menu on a background image."""
-        console.draw_semigraphics(background_image, 0, 0)
+    The menu never changes, so it is drawn once and then copied to the screen.
+    """
+    console = tcod.Console(width, height, order="C")
+    console.draw_semigraphics(background_image, 0, 0)
 
+    console.print(
+        console.width // 2,
+        console.height // 2 - 4,
+        "TOMBS OF THE ANCIENT KINGS",
+        fg=color.menu_title,
+        alignment=tcod.CENTER,
+    )
+    console.print(
+        console.width // 2,
+        console.height - 2,
+        "By Rudraksh",
+        fg=color.menu_title,
+        alignment=tcod.CENTER,
+    )
+
+    menu_width = 24
+    for i, text in enumerate(
+        ["[N] Play a new game", "[C] Continue last game", "[Q] Quit"]
+    ):
         console.print(
             console.width // 2,
-            console.height // 2 - 4,
-            "TOMBS OF THE ANCIENT KINGS",
-            fg=color.menu_title,
-            alignment=tcod.CENTER,
-        )
-        console.print(
-            console.width // 2,
-            console.height - 2,
-            "By Rudraksh",
-            fg=color.menu_title,
+            console.height // 2 - 2 + i,
+            text.ljust(menu_width),
+            fg=color.menu_text,
+            bg=color.black,
             alignment=tcod.CENTER,
+            bg_blend=tcod.BKGND_ALPHA(64),
         )
+    return console
 
-        menu_width = 24
-        for i, text in enumerate(
-            ["[N] Play a new game", "[C] Continue last game", "[Q] Quit"]
-        ):
-            console.print(
-                console.width // 2,
-                console.height // 2 - 2 + i,
-                text.ljust(menu_width),
-                fg=color.menu_text,
-                bg=color.black,
-                alignment=tcod.CENTER,
-                bg_blend=tcod.BKGND_ALPHA(64),
-            )
+
+class MainMenu(input_handlers.BaseEventHandler):
+    """Handle the main menu rendering and input."""
+
+    def on_render(self, console: tcod.Console) -> None:
+        """Render the main menu on a background image."""
+        get_menu_console(console.width, console.height).blit(console)
 
     def ev_keydown(
         self, event: tcod.event.KeyDown
     ) -> Optional[input_handlers.BaseEventHandler]:
-        if event.sym in (tcod.event.K_q, tcod.event.K_ESCAPE):
+        key = event.sym
+        if key in QUIT_KEYS:
             raise SystemExit()
-        elif event.sym == tcod.event.K_c:
+        elif key == CONTINUE_KEY:
             try:
                 return input_handlers.MainGameEventHandler(load_game("savegame.sav"))
             except FileNotFoundError:
                 return input_handlers.PopupMessage(self, "No saved game to load.")
             except Exception as exc:
-                traceback.print_exc()  # Print to stderr.
+                logger.exception("Failed to load the saved game.")
                 return input_handlers.PopupMessage(self, f"Failed to load save:\n{exc}")
-        elif event.sym == tcod.event.K_n:
+        elif key == NEW_GAME_KEY:
             return input_handlers.MainGameEventHandler(new_game())
 
         return None